@@ -1,7 +1,9 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QGraphicsScene, QGraphicsPixmapItem, QGraphicsTextItem, QListWidgetItem
-from PyQt5.QtCore import Qt, QSettings
-from PyQt5.QtGui import QPixmap, QFont, QIcon
-import sys, os, datetime, subprocess, warnings
+from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QGraphicsScene, QGraphicsPixmapItem, QGraphicsTextItem, QListWidgetItem, QListView
+from PyQt5.QtCore import Qt, QEvent, QSettings, QTimer, QFileSystemWatcher, QThread, QThreadPool, QRunnable, QObject, QProcess, QStandardPaths, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon, QImageReader
+import sys, os, time, html, json, warnings, threading, hashlib
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 from main_ui import Ui_MainWindow  # Ui_MainWindow is the class in main_ui.py
 from enum import Enum
 from assets import resources_rc  # Import the compiled resource module
@@ -10,6 +12,26 @@ from assets import resources_rc  # Import the compiled resource module
 # Ignore the deprecation warning
 warnings.filterwarnings(action='ignore', category=DeprecationWarning, lineno=21)
 
+# Folders inside "Mods" that hold 3DMigoto data rather than mods, matched anywhere in a folder's name. Never searched for mods
+IGNORED_MOD_DIRS = ("BufferValues", "ShaderCache", "ShaderFixes")
+# Folders left by tooling rather than mods, matched by their exact name. Never searched for mods
+IGNORED_MOD_DIR_NAMES = frozenset({".git", "__pycache__"})
+# Prefix that marks a mod directory as disabled
+DISABLED_PREFIX = "DISABLED"
+DISABLED_PREFIX_LEN = len(DISABLED_PREFIX)
+# Mod list items added per pass of the event loop, so very large lists do not freeze the UI
+LIST_CHUNK_SIZE = 200
+# Log entries kept in the log, older ones are dropped so the log stays fast over long sessions
+LOG_MAX_ENTRIES = 1000
+# Extensions of the scripts getScript() can run, lowercase
+SCRIPT_EXTENSIONS = (".exe", ".py")
+# Extensions of the images used for previews and the logo, lowercase
+IMAGE_EXTENSIONS = (".png", ".jpg")
+# Bytes of scaled previews kept on disk between sessions, the least recently used are removed past this
+PREVIEW_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Milliseconds closing the window waits for a running script, before asking whether to stop it
+SCRIPT_CLOSE_WAIT_MS = 3000
+
 # Helper class for defining colors of logged messages
 class Color(Enum):
     SUCCESS = '#188524'
@@ -17,6 +39,115 @@ class Color(Enum):
     ERROR = '#B30000'
     INFO = '#5050FF'
 
+# Helper class for scanning directories for mods without blocking the UI
+class ModScanThread(QThread):
+    scanned = pyqtSignal(object, object, object, object)    # (mod directories, directories searched, their mtimes, OSError), all but the error are None on error
+
+    def __init__(self, paths, ignore=(), ignore_names=frozenset(), skip=frozenset(), incremental=False, parent=None):
+        """
+        Parameters:
+        paths (list): The directories to scan, with findModDirsParallel() for a full scan or findModDirs() otherwise.
+        ignore (tuple): Directory names passed on to the search to skip.
+        ignore_names (set): Exact directory names passed on to the search to skip.
+        skip (set): Directories not to descend into, passed on to the search.
+        incremental (bool): If True, a directory in paths that cannot be listed, e.g. because it was
+                            removed, holds no mods. If False, the scan fails with its error.
+        parent (QObject, optional): Owner of the thread.
+        """
+        super(ModScanThread, self).__init__(parent)
+        self.paths = paths
+        self.ignore = ignore
+        self.ignore_names = ignore_names
+        self.skip = skip
+        self.incremental = incremental
+
+    def run(self):
+        """
+        Scan self.paths on the worker thread and emit the result with scanned.
+        """
+        mod_dirs = []
+        searched_dirs = []
+        # Modification times of the directories listed, they change when entries are added, removed or renamed.
+        # Taken before each directory is listed, so a change made while it is listed is picked up next time
+        listed_mtimes = {}
+        for path in self.paths:
+            try:
+                if self.incremental:
+                    # Small changed directories, not worth starting a thread pool for
+                    mod_dirs.extend(findModDirs(path, self.ignore, searched_dirs, self.skip, ignore_names=self.ignore_names, mtimes=listed_mtimes))
+                else:
+                    mod_dirs.extend(findModDirsParallel(path, self.ignore, searched_dirs, self.skip, self.ignore_names, listed_mtimes))
+            except OSError as e:
+                if not self.incremental:
+                    self.scanned.emit(None, None, None, e)
+                    return
+        # Directories in skip were not listed again, their recorded times still apply
+        dir_mtimes = {path: listed_mtimes[path] for path in searched_dirs + mod_dirs if path in listed_mtimes}
+        self.scanned.emit(mod_dirs, searched_dirs, dir_mtimes, None)
+
+# Helper classes for loading preview images without blocking the UI
+class PreviewLoaderSignals(QObject):
+    loaded = pyqtSignal(int, object)    # (generation, QImage)
+
+class PreviewLoader(QRunnable):
+
+    def __init__(self, image_path, width, height, generation):
+        """
+        Parameters:
+        image_path (str): The image to load.
+        width (int): The width of the preview view.
+        height (int): The height of the preview view.
+        generation (int): Identifies the request, passed back with the loaded image.
+        """
+        super(PreviewLoader, self).__init__()
+        self.image_path = image_path
+        self.width = width
+        self.height = height
+        self.generation = generation
+        self.signals = PreviewLoaderSignals()
+
+    def run(self):
+        """
+        Load the image on a worker thread, cropped to the view, and emit it with signals.loaded.
+        """
+        image = loadImage(self.image_path, self.width, self.height)
+        if not image.isNull():
+            # Calculate cropping area
+            x_offset = (image.width() - self.width) // 2
+            y_offset = (image.height() - self.height) // 2
+            image = image.copy(x_offset, y_offset, self.width, self.height)
+        self.signals.loaded.emit(self.generation, image)
+
+# Helper classes for finding a mod's preview images without blocking the UI
+class ImageFinderSignals(QObject):
+    found = pyqtSignal(int, str)    # (generation, image path)
+    finished = pyqtSignal(int, str)     # (generation, mod directory)
+
+class ImageFinder(QRunnable):
+
+    def __init__(self, mod_dir, generation, cancel):
+        """
+        Parameters:
+        mod_dir (str): The mod directory to search with findImages().
+        generation (int): Identifies the request, passed back with every image found.
+        cancel (threading.Event): Set once the images are no longer wanted, which stops the search.
+        """
+        super(ImageFinder, self).__init__()
+        self.mod_dir = mod_dir
+        self.generation = generation
+        self.cancel = cancel
+        self.signals = ImageFinderSignals()
+
+    def run(self):
+        """
+        Search on a worker thread, emitting each image with signals.found as soon as it is found.
+        """
+        for image_path in findImages(self.mod_dir):
+            if self.cancel.is_set():
+                return
+            self.signals.found.emit(self.generation, image_path)
+        self.signals.finished.emit(self.generation, self.mod_dir)
+
 
 class Main(QMainWindow):
 
@@ -30,25 +161,28 @@ class Main(QMainWindow):
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.settings = QSettings("github.io/jvill171", "GIMI ModUI")  # Initialize QSettings
+        self.modding_dir = os.path.join(os.getcwd(), "Mods")  # Resolved once, runScript temporarily changes the cwd
+        self.mod_paths = {}     # Mod directory name => full path, rebuilt by populateModLists()
+        self.mod_search_results = {}    # Mod name => findModDirectory() result, for names not in mod_paths
+        self.mod_images = {}    # Mod directory => its preview images, as found by findImages()
+        self.listed_mod_dirs = set()    # Full paths of every mod directory currently listed
+        self.dir_mtimes = {}    # Full path => st_mtime_ns of every directory listed by the last scans, see saveModIndex()
+        self.log_batch = None   # When a list, logMessage() collects entries here instead of appending each one
+        self.mod_scan_thread = None     # Latest ModScanThread started, results of older scans are ignored
+        self.preview_generation = 0     # Bumped whenever the preview changes, so stale image loads are dropped
+        self.image_search_generation = 0    # Bumped whenever the selection changes, so stale images found are dropped
+        self.image_search_cancel = None     # threading.Event of the ImageFinder still running, if any
+        self.image_search_buttons = []  # Carousel buttons of the list the running ImageFinder searches for
+        self.script_process = None  # QProcess of the script started by runScript(), while it runs
+        self.script_output = ""     # Script output received after its last complete line
+        self.light_styles = getMainStyles()     # Built once, toggle_mode() only swaps them
+        self.dark_styles = getDarkStyles()
         self.initUI()
-        self.setIcon()  # Set the application icon
         
         self.carousel_images = []
         self.carousel_idx = 0
     
 
-    def setIcon(self):
-        """
-        Apply the logo icon
-        """
-        for root, _, files in os.walk(os.getcwd()):
-            for file in files:
-                if file == "LogoImg.png" or file == "LogoImg.jpg":
-                    self.setWindowIcon(QIcon(os.path.join(root, file)))
-                    return;
-            return; # Only observe top level
-
-
     def initUI(self):
         """
         Set up the initial UI settings.
@@ -56,15 +190,74 @@ class Main(QMainWindow):
         Connect signals, and set up any initial settings.
         """
         self.setWindowTitle('GIMI ModUI')
+        # One scene is shared by both image previews and reused for every update
+        self.preview_scene = QGraphicsScene(self)
+        self.ui.previewModImage.setScene(self.preview_scene)
+        self.ui.previewMergeImage.setScene(self.preview_scene)
+        # The scene keeps one pixmap and one placeholder text item, shown or hidden as the preview changes
+        self.preview_pixmap_item = QGraphicsPixmapItem()
+        self.preview_text_item = QGraphicsTextItem()
+        self.preview_text_item.setFont(QFont("Arial", 12))
+        self.preview_scene.addItem(self.preview_pixmap_item)
+        self.preview_scene.addItem(self.preview_text_item)
+        self.setPreviewItems()
+        # mod_status => (list, preview label, carousel buttons) used by updatePreview
+        self.preview_widgets = {
+            "Enabled": (self.ui.enabledModList, self.ui.previewModLabel, [self.ui.previewModBackButton, self.ui.previewModNextButton]),
+            "Disabled": (self.ui.disabledModList, self.ui.previewModLabel, [self.ui.previewModBackButton, self.ui.previewModNextButton]),
+            "Merge": (self.ui.mergeModList, self.ui.previewMergeLabel, [self.ui.previewMergeBackButton, self.ui.previewMergeNextButton]),
+        }
+        # Coalesce rapid selection changes (e.g. holding an arrow key) into a single preview update
+        self.pending_preview_status = ""
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(80)
+        self.preview_timer.timeout.connect(self.runPendingPreview)
+        self.preview_deferred = False   # Set while the window is minimized and a preview is waiting
+        self.ui.logTextEdit.document().setMaximumBlockCount(LOG_MAX_ENTRIES)   # Each append adds one block
+        # Write a running script's output to the log at most every 50ms, rather than for every chunk it prints
+        self.script_output_timer = QTimer(self)
+        self.script_output_timer.setSingleShot(True)
+        self.script_output_timer.setInterval(50)
+        self.script_output_timer.timeout.connect(self.logScriptOutput)
+        # Every row is one line of text, so rows need not be measured one by one, and long lists are laid out in batches
+        for mod_list in [self.ui.enabledModList, self.ui.disabledModList, self.ui.mergeModList]:
+            mod_list.setUniformItemSizes(True)
+            mod_list.setLayoutMode(QListView.Batched)
+            mod_list.setBatchSize(LIST_CHUNK_SIZE)  # Lay out one chunk added by addPendingListItems() per batch
+        # Add long mod lists a chunk at a time, see queueListItems()
+        self.pending_list_items = {}    # QListWidget => QListWidgetItems not yet added to it
+        self.list_items_timer = QTimer(self)
+        self.list_items_timer.setSingleShot(True)
+        self.list_items_timer.setInterval(0)    # Next pass of the event loop
+        self.list_items_timer.timeout.connect(self.addPendingListItems)
+        # Refresh the mod lists when folders are added, removed or renamed in "Mods"
+        self.mods_refresh_timer = QTimer(self)
+        self.mods_refresh_timer.setSingleShot(True)
+        self.mods_refresh_timer.setInterval(250)
+        self.mods_refresh_timer.timeout.connect(self.refreshChangedDirs)
+        self.changed_dirs = set()   # Directories reported by mods_watcher since the last refresh
+        self.mods_watcher = QFileSystemWatcher(self)    # Watches every directory searched for mods, set by finishModScan()
+        self.mods_watcher.directoryChanged.connect(self.queueChangedDir)
+        # Only search the merge directory again on a tab change if something in it changed
+        self.listed_merge_dir = ""  # Directory the Merge list was last filled from
+        self.merge_dirty = False    # Set by merge_watcher when the listed merge directory changes
+        self.merge_watcher = QFileSystemWatcher(self)   # Watches every directory searched by populateMergeList()
+        self.merge_watcher.directoryChanged.connect(self.markMergeDirty)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowMaximizeButtonHint)  # Disable maximize button
         self.setSignals()
         self.setUnicodeText()
         
-        if self.settings.value("key"): self.ui.swapKeyLineEdit.setText(self.settings.value("key"))
-        if self.settings.value("name"): self.ui.mergeNameLineEdit.setText(self.settings.value("name"))
+        # Read once, saveSetting() keeps these in step with what it writes
+        self.saved_settings = {"key": self.settings.value("key"), "name": self.settings.value("name")}
+        saved_key = self.saved_settings["key"]
+        saved_name = self.saved_settings["name"]
+        if saved_key: self.ui.swapKeyLineEdit.setText(saved_key)
+        if saved_name: self.ui.mergeNameLineEdit.setText(saved_name)
 
         self.updateMergeButton()
-        self.clearPreviewAndRefresh()
+        self.toggleWidget([self.ui.previewModBackButton, self.ui.previewModNextButton], enableWidget=False)
+        self.restoreModLists()  # Rather than scanning all of "Mods", if the last session's index can be used
         self.setIconGraphicsView()
         self.setLightDark() # Set light/dark mode from saved settings
 
@@ -94,8 +287,8 @@ class Main(QMainWindow):
         self.ui.refreshModsButton.clicked.connect(self.populateModLists)
         self.ui.refreshMergeButton.clicked.connect(self.populateMergeList)
         self.ui.patchButton.clicked.connect(self.runPatch)
-        self.ui.addModButton.clicked.connect(lambda: self.moveMods(self.ui.disabledModList, self.ui.enabledModList, "Disabled"))     # Disabled => Enabled
-        self.ui.removeModButton.clicked.connect(lambda: self.moveMods(self.ui.enabledModList, self.ui.disabledModList, "Enabled"))   # Enabled => Disabled
+        self.ui.addModButton.clicked.connect(self.enableSelectedMods)      # Disabled => Enabled
+        self.ui.removeModButton.clicked.connect(self.disableSelectedMods)  # Enabled => Disabled
 
         # Add signals for image preview navigation buttons
         self.ui.previewModBackButton.clicked.connect(self.showPrevImage)
@@ -107,10 +300,10 @@ class Main(QMainWindow):
         self.ui.swapKeyLineEdit.textChanged.connect(self.updateMergeButton)
         self.ui.mergeDirLineEdit.textChanged.connect(self.updateMergeButton)
         
-        # Connect current item change to updatePreview method
-        self.ui.enabledModList.currentItemChanged.connect(lambda: self.updatePreview("Enabled"))
-        self.ui.disabledModList.currentItemChanged.connect(lambda: self.updatePreview("Disabled"))
-        self.ui.mergeModList.currentItemChanged.connect(self.updatePreview)
+        # Connect current item change to updatePreview method, via schedulePreview
+        self.ui.enabledModList.currentItemChanged.connect(partial(self.schedulePreview, "Enabled"))
+        self.ui.disabledModList.currentItemChanged.connect(partial(self.schedulePreview, "Disabled"))
+        self.ui.mergeModList.currentItemChanged.connect(partial(self.schedulePreview, "Merge"))
         
         # When tab is changed
         self.ui.tabWidget.currentChanged.connect(self.clearPreviewAndRefresh)
@@ -132,10 +325,14 @@ class Main(QMainWindow):
         """
         Toggle between light and dark mode
         """
-        if self.dark_mode:
-            self.set_light_mode()
-        else:
-            self.set_dark_mode()
+        self.setUpdatesEnabled(False)   # Repaint once, after every style has changed
+        try:
+            if self.dark_mode:
+                self.set_light_mode()
+            else:
+                self.set_dark_mode()
+        finally:
+            self.setUpdatesEnabled(True)
         self.dark_mode = not self.dark_mode
         self.settings.setValue("dark_mode", self.dark_mode)
         
@@ -148,7 +345,7 @@ class Main(QMainWindow):
         self.ui.switchModeCircle.setStyleSheet("background-color: white; border-radius: 6px; border: 1px solid gray;")
         self.ui.switchModeFrame.setStyleSheet("background-color: lightgray; border-radius: 7px;")
         
-        self.setStyleSheet(getMainStyles())
+        self.setStyleSheet(self.light_styles)
 
     
     def set_dark_mode(self):
@@ -159,14 +356,7 @@ class Main(QMainWindow):
         self.ui.switchModeCircle.setStyleSheet("background-color: gray; border-radius: 6px; border: 1px solid white;")
         self.ui.switchModeFrame.setStyleSheet("background-color: darkgray; border-radius: 7px;")
 
-        self.setStyleSheet(getMainStyles() + """ 
-            #MainWindow, #centralwidget, #manageTab, #mergeTab{
-                background-color: #252530;
-            }
-            .QLabel, .QGroupBox, .QCheckBox:unchecked:enabled{
-                color: white;
-            }
-            """)
+        self.setStyleSheet(self.dark_styles)
 
 
     def clearPreviewAndRefresh(self, index=0):
@@ -174,17 +364,27 @@ class Main(QMainWindow):
         Clear the image preview data and refresh the respective mod lists
         """
         # Clear image preview
+        self.preview_timer.stop()   # Drop any preview still pending from the previous tab
+        self.preview_generation += 1    # Along with any image still loading for it
+        self.cancelImageSearch()
         self.carousel_images = []
-        self.ui.previewModImage.setScene(QGraphicsScene())
-        self.ui.previewMergeImage.setScene(QGraphicsScene())
+        self.setPreviewItems()
 
-        # Refresh tab's list data, in the case files were moved/renamed
+        # Refresh tab's list data, in the case files were moved/renamed.
+        # Lists that are watched and unchanged are kept, with their selection cleared to match the blank preview
         tab_name = self.ui.tabWidget.tabText(index).lower()
         if tab_name == "manage":
-            self.populateModLists()
+            if self.mods_watcher.directories():
+                clearCurrentItem([self.ui.enabledModList, self.ui.disabledModList])    # mods_watcher keeps the lists up to date
+            else:
+                self.populateModLists()     # No scan has finished yet
             self.toggleWidget([self.ui.previewModBackButton, self.ui.previewModNextButton], enableWidget=False)
         if tab_name == "merge":
-            self.populateMergeList()
+            merge_text = self.ui.mergeDirLineEdit.text()
+            if self.merge_dirty or not merge_text or os.path.normpath(merge_text) != self.listed_merge_dir:
+                self.populateMergeList()
+            else:
+                clearCurrentItem([self.ui.mergeModList])
             self.toggleWidget([self.ui.previewMergeBackButton, self.ui.previewMergeNextButton], enableWidget=False)
 
 
@@ -208,7 +408,10 @@ class Main(QMainWindow):
         dict_data (dictionary): Key-value pairs to save into settings.
         """
         for key, value in dict_data.items():
-            self.settings.setValue(key, value)
+            # Compared against the values read at startup, rather than reading the disk/registry again
+            if self.saved_settings.get(key) != value:   # Unchanged values would still be written back to disk/registry
+                self.settings.setValue(key, value)
+                self.saved_settings[key] = value
 
 
     def populateModLists(self):
@@ -217,45 +420,296 @@ class Main(QMainWindow):
 
         This function recursively searches for .ini files within the "Mods" directory.
         Once an .ini file is found, its parent directory is listed in the Enabled or 
-        Disabled section based on its prefix.
+        Disabled section based on its prefix. The search runs in the background and
+        the lists are filled by finishModScan() once it is done.
+
+        Always searches all of "Mods", so the Refresh button recovers from an out of date index.
+        Automatic refreshes only search the directories that changed, see refreshChangedDirs().
         """
-        modding_dir = os.path.join(os.getcwd(), "Mods")
+        self.toggleWidget([self.ui.refreshModsButton], enableWidget=False)  # Re-enabled once the scan is done
+        self.changed_dirs = set()   # Covered by this scan
+        self.startModScan([self.modding_dir], incremental=False)
 
-        if not os.path.exists(modding_dir):
-            self.logMessage(f"Directory {os.path.normpath(modding_dir)} does not exist.", Color.ERROR)
+
+    def queueChangedDir(self, path):
+        """
+        Remember a directory mods_watcher reported as changed, and re-scan it once changes settle.
+
+        Parameters:
+        path (str): The directory that changed.
+        """
+        self.changed_dirs.add(path)
+        self.mods_refresh_timer.start()   # Restarts the countdown if already running
+
+
+    def refreshChangedDirs(self):
+        """
+        Re-scan only the directories changed since the last refresh, e.g. by a change made
+        outside the app, and update the mod lists with the mods that differ.
+        """
+        if self.mod_scan_thread is not None:
+            self.mods_refresh_timer.start()     # Check again once the running scan is done
             return
+        changed_dirs = self.changed_dirs
+        self.changed_dirs = set()
+        # A directory inside another changed directory is covered by the outer one's scan
+        changed_dirs = [path for path in changed_dirs if not isInAny(os.path.dirname(path), changed_dirs)]
+        if changed_dirs:
+            self.startModScan(changed_dirs, incremental=True)
+
 
+    def startModScan(self, paths, incremental):
+        """
+        Scan directories for mods on a ModScanThread.
+
+        Parameters:
+        paths (list): The directories to scan.
+        incremental (bool): If True, paths are directories that changed inside "Mods" and only the mods
+                            in them are updated. If False, paths is the "Mods" directory and the lists are refilled.
+        """
+        # Watched directories outside the changed ones are unchanged, no need to search them again
+        skip = frozenset(self.mods_watcher.directories()).difference(paths) if incremental else frozenset()
+        scan_thread = ModScanThread(paths, IGNORED_MOD_DIRS, IGNORED_MOD_DIR_NAMES, skip, incremental, self)
+        scan_thread.scanned.connect(lambda mod_dirs, searched_dirs, dir_mtimes, error: self.finishModScan(scan_thread, mod_dirs, searched_dirs, dir_mtimes, error))
+        scan_thread.finished.connect(scan_thread.deleteLater)
+        self.mod_scan_thread = scan_thread
+        scan_thread.start()
+
+
+    def finishModScan(self, scan_thread, mod_dirs, searched_dirs, dir_mtimes, error):
+        """
+        Update the mod lists with the result of a ModScanThread, unless a newer scan has been started since.
+
+        Parameters:
+        scan_thread (ModScanThread): The thread the result came from.
+        mod_dirs (list): Full paths of the mod directories found, None if the scan failed.
+        searched_dirs (list): Full paths of the directories searched, None if the scan failed.
+        dir_mtimes (dict): Full path => st_mtime_ns of the directories listed, None if the scan failed.
+        error (OSError): The error the scan failed with, None if it succeeded.
+        """
+        if scan_thread is not self.mod_scan_thread:
+            return  # Superseded, the newer scan will fill the lists
+        self.mod_scan_thread = None
+        self.toggleWidget([self.ui.refreshModsButton], enableWidget=True)
+
+        if error is not None:
+            # A missing directory is reported by the scan itself, no separate exists() check needed
+            if isinstance(error, (FileNotFoundError, NotADirectoryError)):
+                self.logMessage(f"Directory {os.path.normpath(self.modding_dir)} does not exist.", Color.ERROR)
+            else:
+                self.logMessage(f"Error: {error}", Color.ERROR)
+            return
+
+        watched_dirs = set(self.mods_watcher.directories())
+        if scan_thread.incremental:
+            self.updateModLists(scan_thread.paths, mod_dirs, searched_dirs, scan_thread.skip)
+            # Stop watching directories that were under the changed ones but are no longer searched
+            unwatch_dirs = [path for path in watched_dirs.difference(searched_dirs) if isInAny(path, scan_thread.paths)]
+            # Forget the times of directories under the changed ones, except under those not searched again
+            changed_dirs = set(scan_thread.paths)
+            kept_dirs = scan_thread.skip.intersection(searched_dirs)
+            self.dir_mtimes = {path: mtime for path, mtime in self.dir_mtimes.items()
+                               if not isInAny(path, changed_dirs) or isInAny(path, kept_dirs)}
+            self.dir_mtimes.update(dir_mtimes)
+        else:
+            self.fillModLists(mod_dirs)
+            unwatch_dirs = list(watched_dirs.difference(searched_dirs))
+            self.dir_mtimes = dir_mtimes
+        if unwatch_dirs:
+            self.mods_watcher.removePaths(unwatch_dirs)
+        watch_dirs = [path for path in searched_dirs if path not in watched_dirs]
+        if watch_dirs:
+            self.mods_watcher.addPaths(watch_dirs)
+
+
+    def restoreModLists(self):
+        """
+        Fill the mod lists from the index saved by saveModIndex() at the end of the last session,
+        then re-scan only the directories whose modification time has changed since.
+
+        Falls back to a full scan with populateModLists() if there is no usable index.
+        """
+        try:
+            with open(getModIndexPath(), encoding="utf-8") as index_file:
+                mod_index = json.load(index_file)
+            if mod_index["modding_dir"] != self.modding_dir:
+                raise ValueError("Index is for another Mods directory")
+            mod_dirs = list(mod_index["mod_dirs"])
+            dir_mtimes = dict(mod_index["dir_mtimes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.populateModLists()     # Missing, corrupt or out of date
+            return
+
+        self.fillModLists(mod_dirs)
+        self.dir_mtimes = dir_mtimes
+        searched_dirs = [path for path in dir_mtimes if path not in self.listed_mod_dirs]
+        if searched_dirs:
+            self.mods_watcher.addPaths(searched_dirs)
+        self.queueModifiedDirs()
+        self.refreshChangedDirs()
+
+
+    def queueModifiedDirs(self):
+        """
+        Add every directory in dir_mtimes whose modification time has changed to changed_dirs.
+        Directories with entries added, removed or renamed since are then re-scanned by refreshChangedDirs().
+        """
+        for path, mtime in self.dir_mtimes.items():
+            try:
+                changed = os.stat(path).st_mtime_ns != mtime
+            except OSError:
+                changed = True
+            if changed:
+                self.changed_dirs.add(path)
+
+
+    def saveModIndex(self):
+        """
+        Save the listed mods and the modification times of the directories they were found in,
+        so restoreModLists() can skip re-scanning unchanged directories next session.
+        """
+        if not self.dir_mtimes:
+            return  # Nothing was scanned successfully
+        mod_index = {
+            "modding_dir": self.modding_dir,
+            "mod_dirs": sorted(self.listed_mod_dirs),
+            "dir_mtimes": self.dir_mtimes,
+        }
+        index_path = getModIndexPath()
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(index_path, "w", encoding="utf-8") as index_file:
+                json.dump(mod_index, index_file)
+        except OSError:
+            pass    # Only costs a full scan next session
+
+
+    def updateModLists(self, changed_dirs, mod_dirs, searched_dirs, skipped_dirs):
+        """
+        Add and remove only the mods that differ after changed_dirs were re-scanned.
+
+        Parameters:
+        changed_dirs (list): The directories that were re-scanned.
+        mod_dirs (list): Full paths of the mod directories found in changed_dirs.
+        searched_dirs (list): Full paths of the directories searched, including any reached in skipped_dirs.
+        skipped_dirs (set): Directories that were not searched again, the mods under them are unchanged.
+        """
+        found_dirs = set(mod_dirs)
+        changed_dirs = set(changed_dirs)
+        kept_dirs = skipped_dirs.intersection(searched_dirs)  # Unchanged directories that still exist
+        removed_dirs = [mod_dir for mod_dir in self.listed_mod_dirs
+                        if mod_dir not in found_dirs and isInAny(mod_dir, changed_dirs) and not isInAny(mod_dir, kept_dirs)]
+        added_dirs = [mod_dir for mod_dir in mod_dirs if mod_dir not in self.listed_mod_dirs]
+        if not removed_dirs and not added_dirs:
+            return
+
+        # Keep the mod directory index in sync
+        self.listed_mod_dirs.difference_update(removed_dirs)
+        self.listed_mod_dirs.update(added_dirs)
+        removed_tooltips = set()
+        for mod_dir in removed_dirs:
+            mod_name = os.path.basename(mod_dir)
+            if self.mod_paths.get(mod_name) == mod_dir:
+                del self.mod_paths[mod_name]
+            self.mod_images.pop(mod_dir, None)
+            removed_tooltips.add(os.path.normpath(mod_dir))
+        self.mod_search_results.clear()
+
+        # Remove the items of the mods that are gone, whether already listed or still waiting to be
+        for mod_list in [self.ui.enabledModList, self.ui.disabledModList]:
+            for row in reversed(range(mod_list.count())):
+                if mod_list.item(row).toolTip() in removed_tooltips:
+                    mod_list.takeItem(row)
+            pending_items = self.pending_list_items.get(mod_list, [])
+            pending_items[:] = [item for item in pending_items if item.toolTip() not in removed_tooltips]
+
+        # Add items for the new mods
         enabled_mods = []
         disabled_mods = []
+        for root in added_dirs:
+            mod_name = os.path.basename(root)
+            mod_item = createModItem(root)
+            self.mod_paths.setdefault(mod_name, root)
 
-        for root, dirs, files in os.walk(modding_dir):
-            if "BufferValues" in root or "ShaderCache" in root or "ShaderFixes" in root:
-                continue;
-            for file in files:
-                if file.endswith(".ini"):
-                    mod_item = QListWidgetItem(os.path.basename(root))
-                    mod_item.setToolTip(os.path.normpath(root))
-                    
-                    if os.path.basename(root).startswith("DISABLED"):
-                        disabled_mods.append(mod_item)
-                    else:
-                        enabled_mods.append(mod_item)
-                        
-                    # Stop searching deeper once an .ini file is found
-                    dirs[:] = []
-                    break
-
-        # Populate the lists in the UI
-        self.ui.enabledModList.clear()
-        self.ui.disabledModList.clear()
+            if mod_name.startswith(DISABLED_PREFIX):
+                disabled_mods.append(mod_item)
+            else:
+                enabled_mods.append(mod_item)
+        self.queueListItems(self.ui.enabledModList, enabled_mods)
+        self.queueListItems(self.ui.disabledModList, disabled_mods)
+
+
+    def fillModLists(self, mod_dirs):
+        """
+        Fill the "Enabled" and "Disabled" lists and the mod directory index.
+
+        Parameters:
+        mod_dirs (list): Full paths of the mod directories found by findModDirsParallel().
+        """
+        modding_dir = self.modding_dir
+        enabled_mods = []
+        disabled_mods = []
+        self.mod_paths = {}
+        self.mod_search_results = {}
+        self.mod_images = {}
+        self.listed_mod_dirs = set(mod_dirs)
+
+        for root in mod_dirs:
+            mod_name = os.path.basename(root)
+            mod_item = createModItem(root)
+            self.mod_paths.setdefault(mod_name, root)    # Keep the first match, as findModDirectory would
+
+            if mod_name.startswith(DISABLED_PREFIX):
+                disabled_mods.append(mod_item)
+            else:
+                enabled_mods.append(mod_item)
+
+        # Populate the lists in the UI, without a currentItemChanged for every removed item
+        mod_lists = [self.ui.enabledModList, self.ui.disabledModList]
+        for mod_list in mod_lists:
+            mod_list.blockSignals(True)
+        try:
+            for mod_list in mod_lists:
+                self.pending_list_items.pop(mod_list, None)  # Drop what is left of a previous fill
+                mod_list.clear()
+            self.queueListItems(self.ui.enabledModList, enabled_mods)
+            self.queueListItems(self.ui.disabledModList, disabled_mods)
+        finally:
+            for mod_list in mod_lists:
+                mod_list.blockSignals(False)
+
+        # The selection was cleared, update the preview once if it showed one of these lists
+        if self.pending_preview_status in ("Enabled", "Disabled"):
+            self.schedulePreview(self.pending_preview_status)
 
         if len(enabled_mods) == 0 and len(disabled_mods) == 0:
             self.logMessage(f"No mods found in {modding_dir} or its children directories.", Color.WARNING)
-        else:
-            for item in enabled_mods:
-                self.ui.enabledModList.addItem(item)
-            for item in disabled_mods:
-                self.ui.disabledModList.addItem(item)
+
+
+    def queueListItems(self, list_widget, items):
+        """
+        Add items to a QListWidget, LIST_CHUNK_SIZE at a time.
+
+        The first chunk is added straight away, the rest by addPendingListItems() on later
+        passes of the event loop, so the UI stays responsive while thousands of mods are listed.
+
+        Parameters:
+        list_widget (QListWidget): The list to add the items to.
+        items (list): The QListWidgetItems to add.
+        """
+        self.pending_list_items.setdefault(list_widget, []).extend(items)
+        self.addPendingListItems()
+
+
+    def addPendingListItems(self):
+        """
+        Add the next chunk of every list's pending items, and schedule the following chunk if any are left.
+        """
+        for list_widget, pending_items in self.pending_list_items.items():
+            addListItems(list_widget, pending_items[:LIST_CHUNK_SIZE])
+            del pending_items[:LIST_CHUNK_SIZE]
+        if any(self.pending_list_items.values()):
+            self.list_items_timer.start()
 
 
     def populateMergeList(self):
@@ -266,29 +720,61 @@ class Main(QMainWindow):
         specified in QLineEdit.mergeDirLineEdit QWidget. Once an .ini file is
         found, its parent directory is listed in the Merge list.
         """
-        merge_dir = os.path.normpath( self.ui.mergeDirLineEdit.text() )
+        merge_text = self.ui.mergeDirLineEdit.text()
+        if not merge_text:
+            return  # No directory chosen yet. normpath("") is ".", which would list the app's own folder
+        merge_dir = os.path.normpath(merge_text)
 
-        if not os.path.exists(merge_dir):
-            if merge_dir != "": self.logMessage(f"Directory {os.path.normpath(merge_dir)} does not exist.", Color.ERROR)
+        if not os.path.isdir(merge_dir):
+            self.logMessage(f"Directory {merge_dir} does not exist.", Color.ERROR)
             return
         
-        self.ui.mergeModList.clear()
+        self.mod_images = {}    # Find the merge mods' images again too
         
-        for root, dirs, files in os.walk(merge_dir):
-            for file in files:
-                if file.endswith(".ini"):
-                    item = QListWidgetItem(os.path.basename(root))
-                    item.setToolTip(os.path.normpath(root))
-                    self.ui.mergeModList.addItem(item)
-                    # Stop searching deeper once an .ini file is found
-                    dirs[:] = []
-                    break
+        merge_items = []
+        searched_dirs = []
+        try:
+            for root in findModDirs(merge_dir, searched=searched_dirs):
+                merge_items.append(createModItem(root))
+        except OSError as e:
+            self.logMessage(f"Error: {e}", Color.ERROR)
+
+        # Refill the list in one batch, without a currentItemChanged for every removed item
+        merge_list = self.ui.mergeModList
+        merge_list.blockSignals(True)
+        try:
+            merge_list.clear()
+            addListItems(merge_list, merge_items)
+        finally:
+            merge_list.blockSignals(False)
+        if self.pending_preview_status == "Merge":
+            self.schedulePreview("Merge")   # The selection was cleared, update the preview once
+
+        # Watch what was searched, so the next tab change knows whether to search again
+        watched_dirs = self.merge_watcher.directories()
+        if watched_dirs:
+            self.merge_watcher.removePaths(watched_dirs)
+        merge_dirs = searched_dirs + [merge_item.data(Qt.UserRole) for merge_item in merge_items]
+        if merge_dirs:
+            self.merge_watcher.addPaths(merge_dirs)
+        self.listed_merge_dir = merge_dir
+        self.merge_dirty = False
 
         self.updateMergeButton()    # Check if Merge button can be enabled
-        if self.ui.mergeDirLineEdit.text() != "" and self.ui.mergeModList.count() <= 1:
+        if self.ui.mergeModList.count() <= 1:
             self.logMessage("Less than 2 mods found. Unable to merge anything.", Color.WARNING)
         
 
+    def markMergeDirty(self, path):
+        """
+        Note that the listed merge directory has changed, so the next tab change searches it again.
+
+        Parameters:
+        path (str): The directory merge_watcher reported, unused.
+        """
+        self.merge_dirty = True
+
+
     def browseMergeDir(self):
         """
         Open a file dialog to select the folder contianing mods to be merged.
@@ -297,7 +783,8 @@ class Main(QMainWindow):
         mod directories using populateMergeList().
         """
         options = QFileDialog.Options(QFileDialog.ShowDirsOnly)   # Only show directories
-        directory = QFileDialog.getExistingDirectory(self, "Select folder containing mods to merge", options=options)
+        start_dir = self.ui.mergeDirLineEdit.text() or self.modding_dir   # Open where the user is likely to pick from
+        directory = QFileDialog.getExistingDirectory(self, "Select folder containing mods to merge", start_dir, options=options)
 
         # Display selected directory in QLabel
         if directory:
@@ -326,6 +813,20 @@ class Main(QMainWindow):
                 widget.setEnabled(enableWidget)    # If enabled, disable. If disabled, enable.
 
 
+    def enableSelectedMods(self):
+        """
+        Enable the mods selected in the "Disabled" list, see moveMods().
+        """
+        self.moveMods(self.ui.disabledModList, self.ui.enabledModList, "Disabled")
+
+
+    def disableSelectedMods(self):
+        """
+        Disable the mods selected in the "Enabled" list, see moveMods().
+        """
+        self.moveMods(self.ui.enabledModList, self.ui.disabledModList, "Enabled")
+
+
     def moveMods(self, source_list, target_list, source_status):
         """
         Enable/Disable every directory within source_list by adding/removing the "DISABLED" prefix as necessary.
@@ -342,119 +843,322 @@ class Main(QMainWindow):
         If any error occurs during the rename operation, an error message is printed indicating the failed 
         directory rename.
         """
-        selected_items = source_list.selectedItems()
-        self.toggleWidget([self.ui.addModButton, self.ui.removeModButton]) # Disable buttons while mods are being enabled/disabled
-        for item in selected_items:
-            item_name = item.text()
-            mod_dir = findModDirectory(item_name)
-            prefix = "DISABLED"
-
-            if not mod_dir:
-                self.logMessage(f"Error: Could not find directory for {item_name}. Please [ Refresh Mod List ]", Color.ERROR)
-                continue
-
-            # Determine new directory name & path, for renaming
-            if source_status == "Enabled":
-                new_item_name = prefix + item_name
-                new_status_msg = f"\u2796\u25BA Disabled {item_name}"
+        selected_rows = sorted(index.row() for index in source_list.selectedIndexes())
+        if not selected_rows:
+            return  # Nothing to move
+        move_buttons = [self.ui.addModButton, self.ui.removeModButton]
+        self.toggleWidget(move_buttons, enableWidget=False) # Disable buttons while mods are being enabled/disabled
+        try:
+            self.log_batch = []     # Log every enabled/disabled mod with one append
+            moved_rows = []     # Rows to take out of source_list
+            new_items = []      # Items to add to target_list
+            for row in selected_rows:
+                item_name = source_list.item(row).text()
+                mod_dir = source_list.item(row).data(Qt.UserRole)  # Stored when the item was listed
+                if not mod_dir or not os.path.isdir(mod_dir):
+                    mod_dir = self.getModDirectory(item_name)
+
+                if not mod_dir:
+                    self.logMessage(f"Error: Could not find directory for {item_name}. Please [ Refresh Mod List ]", Color.ERROR)
+                    continue
+
+                # Determine new directory name & path, for renaming
+                if source_status == "Enabled":
+                    new_item_name = DISABLED_PREFIX + item_name
+                    new_status_msg = f"\u2796\u25BA Disabled {item_name}"
+                else:
+                    new_item_name = item_name.removeprefix(DISABLED_PREFIX)
+                    new_status_msg = f"\u2795\u25BA Enabled {new_item_name}"
+                parent_dir, dir_name = os.path.split(mod_dir)
+                dest_path = os.path.join(parent_dir, new_item_name)
+
+                try:
+                    os.rename(mod_dir, dest_path)  # Rename the directory, thus enabling/disabling
+                    self.logMessage(new_status_msg)
+                    # Keep the mod directory index in sync with the rename
+                    if self.mod_paths.get(item_name) == mod_dir:
+                        del self.mod_paths[item_name]
+                    self.mod_paths[new_item_name] = dest_path
+                    self.listed_mod_dirs.discard(mod_dir)
+                    self.listed_mod_dirs.add(dest_path)
+                    self.mod_search_results.clear()     # May hold the old path
+                    self.mod_images.pop(mod_dir, None)
+                    # Kept with a time no directory has, so both are re-scanned next session unless the watcher gets to them first
+                    self.dir_mtimes[mod_dir] = -1
+                    self.dir_mtimes[parent_dir] = -1
+                    # Move from one widget to the other, once every mod has been renamed
+                    moved_rows.append(row)
+
+                    # User manually renamed file to use "DISABLED" and did not refresh the mod list.
+                    if dir_name != item_name:
+                        self.logMessage("Detected issue with directory name. Please [Refresh Mod List]", Color.WARNING)
+
+                    # Create a new QListWidgetItem with updated text, tooltip and path
+                    new_items.append(createModItem(dest_path))
+
+                except Exception as e:
+                    self.logMessage(f"Error: {e}", Color.ERROR)
+
+            # Update both lists in one batch each, rather than relaying them out per mod
+            source_list.setUpdatesEnabled(False)
+            for row in reversed(moved_rows):    # Bottom up, so the rows still to take keep their positions
+                source_list.takeItem(row)
+            source_list.setUpdatesEnabled(True)
+            addListItems(target_list, new_items)
+        finally:
+            # Enable buttons once more after mods have been enabled/disabled, even if something went wrong
+            self.flushLogBatch()
+            self.toggleWidget(move_buttons, enableWidget=True)
+
+
+    def getModDirectory(self, mod_name):
+        """
+        Look up the directory of a mod found by the last populateModLists() scan.
+
+        If the mod is not in the index, e.g. when it is only in the merge list, the directories
+        the last scan searched are checked for it with findModInDirs(), as every mod is directly
+        inside one of them. Only before any scan has finished is the whole "Mods" directory
+        searched with findModDirectory(). The result, found or not, is kept until the mod
+        lists are refreshed so repeated selections do not search again.
+
+        Parameters:
+        mod_name (str): The name of the mod to find.
+
+        Returns:
+            str: The full path to the mod's directory, or an empty string if not found.
+        """
+        mod_dir = self.mod_paths.get(mod_name) or self.mod_paths.get(DISABLED_PREFIX + mod_name)
+        if mod_dir and os.path.isdir(mod_dir):
+            return mod_dir
+        if mod_name not in self.mod_search_results:
+            searched_dirs = self.mods_watcher.directories()
+            if searched_dirs:
+                self.mod_search_results[mod_name] = findModInDirs(mod_name, searched_dirs)
             else:
-                new_item_name = item_name[len(prefix):]
-                new_status_msg = f"\u2795\u25BA Enabled {new_item_name}"
-            dest_path = mod_dir[:-len(item_name)] + new_item_name
+                self.mod_search_results[mod_name] = findModDirectory(mod_name, self.modding_dir)
+        return self.mod_search_results[mod_name]
 
-            try:
-                os.rename(mod_dir, dest_path)  # Rename the directory, thus enabling/disabling
-                self.logMessage(new_status_msg)
-                # Move from one widget to the other
-                source_list.takeItem(source_list.row(item))
 
-                # User manually renamed file to use "DISABLED" and did not refresh the mod list.
-                if new_item_name != os.path.basename(dest_path):
-                    self.logMessage("Detected issue with directory name. Please [Refresh Mod List]", Color.WARNING)
+    def schedulePreview(self, mod_status=""):
+        """
+        Request a preview update for the list given by mod_status.
+
+        The update runs once the selection has been still for preview_timer's interval,
+        so moving through a list only loads the images of the item it stops on.
+        """
+        self.pending_preview_status = mod_status
+        self.preview_timer.start()  # Restarts the countdown if already running
+
+
+    def runPendingPreview(self):
+        """
+        Run the preview update requested by schedulePreview(), unless the window is minimized.
+        A preview requested while minimized is run by changeEvent() once the window is restored.
+        """
+        if self.isMinimized():
+            self.preview_deferred = True
+            return
+        self.updatePreview(self.pending_preview_status)
 
-                # Create a new QListWidgetItem with updated text and tooltip
-                new_item = QListWidgetItem(new_item_name)
-                new_item.setToolTip(os.path.normpath(dest_path))
-                target_list.addItem(new_item)
 
-            except Exception as e:
-                self.logMessage(f"Error: {e}", Color.ERROR)
-        self.toggleWidget([self.ui.addModButton, self.ui.removeModButton]) # Enable buttons once more after mods have been enabled/disabled
+    def changeEvent(self, event):
+        """
+        Run a preview update deferred by runPendingPreview() once the window is no longer minimized.
+        """
+        if event.type() == QEvent.WindowStateChange and self.preview_deferred and not self.isMinimized():
+            self.preview_deferred = False
+            self.preview_timer.start()
+        super(Main, self).changeEvent(event)
 
 
     def updatePreview(self, mod_status=""):
         """
         Update the mod name label and image preview based on the current selection.
         """
-        # Determine the selected list based on mod_status
-        if mod_status == "Enabled": 
-            selected_list = self.ui.enabledModList
-        elif mod_status == "Disabled":
-            selected_list = self.ui.disabledModList
-        else:
-            selected_list = self.ui.mergeModList
+        # Determine the selected list, and the preview widgets that belong to it, based on mod_status
+        selected_list, preview_label, carousel_buttons = self.preview_widgets.get(mod_status, self.preview_widgets["Merge"])
 
+        # The list's tab is not shown, e.g. the Mods folder changed while on the Merge tab.
+        # Both tabs share the preview scene, and switching tabs resets the preview anyway
+        if not selected_list.isVisible():
+            return
+
+        self.cancelImageSearch()    # Images still being found belong to the previous selection
         if selected_list:
             selected_item = selected_list.currentItem()
             if selected_item:
                 mod_name = selected_item.text()
-                mod_directory = findModDirectory(mod_name)
-                self.ui.previewModLabel.setText(mod_name)
+                # The path stored on the item saves looking the mod up by name
+                mod_directory = selected_item.data(Qt.UserRole) or self.getModDirectory(mod_name)
+                preview_label.setText(mod_name)
                 
-                # Load images from the mod directory
-                self.carousel_images = [] # Empty existing carousel_images
-                for root, dirs, files in os.walk(mod_directory):
-                    for file in files:
-                        if(file.lower().endswith(('.png', '.jpg'))):
-                            self.carousel_images.append(os.path.join(root, file))
-                self.toggleWidget([self.ui.previewModBackButton, self.ui.previewModNextButton], len(self.carousel_images) > 1) # Enable carousel if more than 1 image, else disable
+                # Load images from the mod directory, searched once per mod until the lists are refreshed
                 self.carousel_idx = 0
-                self.displayCurrentImage()  # Display the first image in the carousel
+                if mod_directory in self.mod_images:
+                    self.carousel_images = self.mod_images[mod_directory]
+                    self.toggleWidget(carousel_buttons, len(self.carousel_images) > 1) # Enable carousel if more than 1 image, else disable
+                    self.displayCurrentImage()  # Display the first image in the carousel
+                else:
+                    self.startImageSearch(mod_directory, carousel_buttons)
             else:
                 # Handle case where no item is selected in the list
-                self.ui.previewModLabel.setText("")
-                scene = QGraphicsScene()
-                self.ui.previewModImage.setScene(scene)
+                preview_label.setText("")
+                self.preview_generation += 1
+                self.setPreviewItems()
         else:
             # Handle unknown mod_status
-            self.ui.previewModLabel.setText("")
-            scene = QGraphicsScene()
-            self.ui.previewModImage.setScene(scene)
+            preview_label.setText("")
+            self.preview_generation += 1
+            self.setPreviewItems()
+
+
+    def startImageSearch(self, mod_directory, carousel_buttons):
+        """
+        Find the images of a mod with an ImageFinder on the global QThreadPool.
+
+        The preview is blank until the first image is found, which addFoundImage() then displays.
+
+        Parameters:
+        mod_directory (str): The mod directory to search.
+        carousel_buttons (list): The carousel buttons to enable once a second image is found.
+        """
+        self.carousel_images = []
+        self.image_search_buttons = carousel_buttons
+        self.toggleWidget(carousel_buttons, enableWidget=False)
+        self.preview_generation += 1
+        self.setPreviewItems()
+
+        self.image_search_cancel = threading.Event()
+        finder = ImageFinder(mod_directory, self.image_search_generation, self.image_search_cancel)
+        finder.signals.found.connect(self.addFoundImage)
+        finder.signals.finished.connect(self.finishImageSearch)
+        QThreadPool.globalInstance().start(finder)
+
+
+    def addFoundImage(self, generation, image_path):
+        """
+        Add an image found by an ImageFinder to the carousel, unless the selection has changed since.
+
+        Parameters:
+        generation (int): The image_search_generation the search was started with.
+        image_path (str): The image found.
+        """
+        if generation != self.image_search_generation:
+            return
+        self.carousel_images.append(image_path)
+        if len(self.carousel_images) == 1:
+            self.displayCurrentImage()  # Display the first image without waiting for the rest
+        elif len(self.carousel_images) == 2:
+            self.toggleWidget(self.image_search_buttons, enableWidget=True)
+            self.prefetchNeighbors(self.preview_generation)     # There was nothing to prefetch when the first was shown
+
+
+    def finishImageSearch(self, generation, mod_directory):
+        """
+        Remember the images an ImageFinder found once it is done, unless the selection has changed since.
+
+        Parameters:
+        generation (int): The image_search_generation the search was started with.
+        mod_directory (str): The mod directory searched.
+        """
+        if generation != self.image_search_generation:
+            return
+        self.image_search_cancel = None
+        self.mod_images[mod_directory] = self.carousel_images
+        if not self.carousel_images:
+            self.displayCurrentImage()  # Shows the "[ No Preview ]" placeholder
+
+
+    def cancelImageSearch(self):
+        """
+        Stop the running ImageFinder, if any, and drop anything it still emits.
+        """
+        self.image_search_generation += 1
+        if self.image_search_cancel is not None:
+            self.image_search_cancel.set()
+            self.image_search_cancel = None
 
 
     def displayCurrentImage(self):
-        """Display the current image in the carousel."""
-        scene = QGraphicsScene()
+        """
+        Display the current image in the carousel.
+
+        The image is loaded by a PreviewLoader on the global QThreadPool and shown by
+        showLoadedImage(), so decoding a large image does not block the UI. An image loaded
+        before at the view's size comes from cachedImage()'s cache without being decoded again.
+        """
+        self.preview_generation += 1    # Any image still loading for an earlier request is now stale
         if self.carousel_images:
             image_path = self.carousel_images[self.carousel_idx]
-            pixmap = QPixmap(image_path)
-            
-            if pixmap.isNull():
-                placeholder_text = QGraphicsTextItem("[ Image Load Failed ]")
-                placeholder_text.setFont(QFont("Arial", 12))
-                scene.addItem(placeholder_text)
-            else:
-                # Get the dimensions of the QGraphicsView
-                view_width = self.ui.previewModImage.viewport().width()
-                view_height = self.ui.previewModImage.viewport().height()
-                # Scale the pixmap
-                scaled_pixmap = pixmap.scaled(view_width, view_height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                # Calculate cropping area
-                x_offset = (scaled_pixmap.width() - view_width) / 2
-                y_offset = (scaled_pixmap.height() - view_height) / 2
-                cropped_pixmap = scaled_pixmap.copy(x_offset, y_offset, view_width, view_height)
-
-                pixmap_item = QGraphicsPixmapItem(cropped_pixmap)
-                scene.addItem(pixmap_item)
+            # Get the dimensions of the QGraphicsView
+            view_width = self.ui.previewModImage.viewport().width()
+            view_height = self.ui.previewModImage.viewport().height()
+            # Load the image already scaled to cover the view
+            loader = PreviewLoader(image_path, view_width, view_height, self.preview_generation)
+            loader.signals.loaded.connect(self.showLoadedImage)
+            QThreadPool.globalInstance().start(loader)
+            # Once idle, get the images either side ready for the carousel buttons
+            QTimer.singleShot(0, partial(self.prefetchNeighbors, self.preview_generation))
         else:
-            placeholder_text = QGraphicsTextItem()
-            placeholder_text = QGraphicsTextItem("[ No Preview ]")
-            placeholder_text.setFont(QFont("Arial", 12))
-            scene.addItem(placeholder_text)
-        
-        # Set the scene for previewModImage QGraphicsView
-        self.ui.previewModImage.setScene(scene)
-        self.ui.previewMergeImage.setScene(scene)
+            self.setPreviewItems(text="[ No Preview ]")
+
+
+    def showLoadedImage(self, generation, image):
+        """
+        Show an image loaded by a PreviewLoader, unless another image has been requested since.
+
+        Parameters:
+        generation (int): The preview_generation the image was requested with.
+        image (QImage): The cropped image. A null QImage if it could not be loaded.
+        """
+        if generation != self.preview_generation:
+            return  # The selection moved on while this image was loading
+        if image.isNull():
+            self.setPreviewItems(text="[ Image Load Failed ]")
+        else:
+            self.setPreviewItems(pixmap=QPixmap.fromImage(image))
+
+
+    def prefetchNeighbors(self, generation):
+        """
+        Load the carousel images before and after the current one into cachedImage()'s cache,
+        so the carousel buttons can show them without waiting for them to be decoded.
+
+        Parameters:
+        generation (int): The preview_generation of the image displayCurrentImage() showed.
+                          If the preview has changed since, nothing is loaded.
+        """
+        image_count = len(self.carousel_images)
+        if generation != self.preview_generation or image_count < 2:
+            return
+        view_width = self.ui.previewModImage.viewport().width()
+        view_height = self.ui.previewModImage.viewport().height()
+        neighbors = dict.fromkeys([(self.carousel_idx + 1) % image_count, (self.carousel_idx - 1) % image_count])
+        for idx in neighbors:
+            loader = PreviewLoader(self.carousel_images[idx], view_width, view_height, generation)
+            QThreadPool.globalInstance().start(loader, -1)  # Behind any image that is to be shown, the result is only cached
+
+
+    def setPreviewItems(self, pixmap=None, text=""):
+        """
+        Show an image or a placeholder text in the preview scene, reusing the scene's items.
+
+        With neither, the preview is left blank.
+
+        Parameters:
+        pixmap (QPixmap, optional): The image to show.
+        text (str, optional): The placeholder text to show when there is no image.
+        """
+        self.preview_pixmap_item.setPixmap(pixmap if pixmap is not None else QPixmap())  # Release the previous image
+        self.preview_pixmap_item.setVisible(pixmap is not None)
+        self.preview_text_item.setPlainText(text)
+        self.preview_text_item.setVisible(pixmap is None and bool(text))
+
+        # Fit the scene to whichever item is shown, hidden items still count towards itemsBoundingRect()
+        if self.preview_pixmap_item.isVisible():
+            self.preview_scene.setSceneRect(self.preview_pixmap_item.sceneBoundingRect())
+        elif self.preview_text_item.isVisible():
+            self.preview_scene.setSceneRect(self.preview_text_item.sceneBoundingRect())
 
 
     def showNextImage(self):
@@ -475,14 +1179,16 @@ class Main(QMainWindow):
         """
         Runs a given script (either .py or .exe) on the specified directory.
 
+        The script runs in a QProcess so the UI stays responsive. Its output is written to the
+        log as it arrives by logScriptOutput(), and the result is logged by scriptFinished().
+        The Patch and Merge buttons are disabled until then.
+
         Parameters:
         script_path (str): The path to the script file to be executed.
         target_directory (str): The directory on which the script should operate.
         args: (str): an array of flags and values to pass with the script's command
         input_data (str, optional): Any key presses necessary to run the specified script
         """
-        original_cwd = os.getcwd()  # Save current working directory
-
         try:
             # Validate script_path and target_directory
             if not os.path.isfile(script_path):
@@ -490,39 +1196,103 @@ class Main(QMainWindow):
 
             if not os.path.isdir(target_directory):
                 raise ValueError(f"Target directory {os.path.normpath(target_directory)} does not point to a valid directory.")
-            
-            # Change current working directory to target_directory
-            os.chdir(target_directory)
+
+            if self.script_process is not None:
+                raise ValueError("Another script is still running.")
 
             if script_path.endswith('.py'):
-                # Use Popen to interact with subprocess
-                proc = subprocess.Popen(["python", script_path, *args], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                program, program_args = "python", [script_path, *args]
             elif script_path.endswith('.exe'):
-                proc = subprocess.Popen([script_path, *args], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                program, program_args = script_path, [*args]
             else:
                 raise ValueError("Script must be either a .py or .exe file.")
-            
-            # Optionally, you can send input to the subprocess
-            # Here we simulate sending an 'enter' key press
-            input_data = "\n"
-            stdout, stderr = proc.communicate(input=input_data)
-            print(f"stdout {stdout}\t\t stderr {stderr}")
-            # proc.communicate(input='\n')
-
-            # Optionally, you can wait for the subprocess to finish
-            proc.wait()
 
-            # Check the result
-            if proc.returncode == 0:
-                self.logMessage(f"Script executed successfully!\n", Color.SUCCESS)
-            else:
-                self.logMessage(f"Script returned error code {proc.returncode}.", Color.ERROR)
+            process = QProcess(self)
+            process.setWorkingDirectory(target_directory)  # Run in target_directory without changing our own cwd
+            process.setProcessChannelMode(QProcess.MergedChannels)
+            process.readyReadStandardOutput.connect(self.queueScriptOutput)
+            process.finished.connect(self.scriptFinished)
+            process.errorOccurred.connect(self.scriptError)
+            self.script_process = process
+            self.script_output = ""
+            self.toggleWidget([self.ui.patchButton, self.ui.mergeModsButton], enableWidget=False)
+
+            process.start(program, program_args)
+            # Here we simulate sending an 'enter' key press, then close stdin as communicate() did
+            input_data = "\n"
+            process.write(input_data.encode())
+            process.closeWriteChannel()
 
         except Exception as e:
             self.logMessage(f"Error: {e}")
-        finally:
-            # Restore original working directory
-            os.chdir(original_cwd)
+
+
+    def queueScriptOutput(self):
+        """
+        Have logScriptOutput() write the running script's new output once script_output_timer's interval
+        has passed, so output printed in many small chunks is written to the log together.
+        """
+        if not self.script_output_timer.isActive():
+            self.script_output_timer.start()
+
+
+    def logScriptOutput(self):
+        """
+        Write the complete lines the running script has output so far to the log.
+        """
+        data = self.script_process.readAllStandardOutput().data().decode(errors="replace")
+        *lines, self.script_output = (self.script_output + data).split("\n")
+        lines = [line.rstrip("\r") for line in lines if line.strip()]
+        if lines:
+            self.log_batch = []
+            for line in lines:
+                self.logMessage(html.escape(line))
+            self.flushLogBatch()
+
+
+    def scriptFinished(self, exit_code, exit_status):
+        """
+        Log the result of the script started by runScript() and re-enable the Patch and Merge buttons.
+
+        Parameters:
+        exit_code (int): The script's return code.
+        exit_status (QProcess.ExitStatus): Whether the script exited normally or crashed.
+        """
+        self.script_output_timer.stop()
+        self.logScriptOutput()
+        if self.script_output.strip():
+            self.logMessage(html.escape(self.script_output.strip()))   # Last line, without a line break
+
+        # Check the result
+        if exit_status == QProcess.NormalExit and exit_code == 0:
+            self.logMessage(f"Script executed successfully!\n", Color.SUCCESS)
+        else:
+            self.logMessage(f"Script returned error code {exit_code}.", Color.ERROR)
+        self.clearScriptProcess()
+
+
+    def scriptError(self, error):
+        """
+        Log a script that could not be started. finished is not emitted in that case,
+        any other error is followed by scriptFinished().
+
+        Parameters:
+        error (QProcess.ProcessError): The error that occurred.
+        """
+        if error == QProcess.FailedToStart:
+            self.logMessage(f"Error: {self.script_process.errorString()}", Color.ERROR)
+            self.clearScriptProcess()
+
+
+    def clearScriptProcess(self):
+        """
+        Release the finished script's QProcess and re-enable the Patch and Merge buttons.
+        """
+        self.script_output_timer.stop()
+        self.script_process.deleteLater()
+        self.script_process = None
+        self.toggleWidget([self.ui.patchButton], enableWidget=True)
+        self.updateMergeButton()    # Only enabled if merging is possible
 
 
     def runPatch(self):
@@ -531,7 +1301,7 @@ class Main(QMainWindow):
         """
         try:
             patch_script = getScript(os.path.join(os.getcwd(), "Scripts"),"PATCH")
-            target_dir = os.path.join(os.getcwd(), "Mods")
+            target_dir = self.modding_dir
 
             self.logMessage("Running [PATCH] script")
             self.runScript(patch_script, target_dir, [], "\n")
@@ -547,8 +1317,8 @@ class Main(QMainWindow):
         """
         # Flags that take args
         kFlagVal = self.ui.swapKeyLineEdit.text()              # --key
-        nFlagVal = (self.ui.mergeNameLineEdit.text() if self.ui.mergeNameLineEdit.text() != "" else "merged") + ".ini"    # --name
-        rFlagVal = self.ui.mergeDirLineEdit.text() if self.ui.mergeDirLineEdit.text() != "" else "."                      # --root
+        nFlagVal = (self.ui.mergeNameLineEdit.text() or "merged") + ".ini"    # --name
+        rFlagVal = self.ui.mergeDirLineEdit.text() or "."                      # --root
 
         # Flags dont take args
         aFlag = self.ui.activeFlagCheckBox.isChecked()         # --active
@@ -575,27 +1345,6 @@ class Main(QMainWindow):
         return result
 
 
-    def getModOrder(self, path, ignore):
-        base_dict = {}  # Dictionary holding base assumed order
-        new_order = []  # List taking assumed order user desires
-        
-        for root, dir, files in os.walk(path):
-            if "disabled" in root.lower():
-                continue
-            for file in files:
-                if "disabled" in file.lower() or ignore.lower() in file.lower():
-                    continue
-                if os.path.splitext(file)[1] == ".ini":
-                    base_dict[os.path.basename(root)] = len(base_dict)  # mod_name: idx
-        
-        for index in range(self.ui.mergeModList.count()):
-            new_order.append( base_dict[self.ui.mergeModList.item(index).text()] )
-
-        print(f"base_dict: {base_dict}")
-        print(f"\nnew : {new_order}\n")
-        return new_order
-
-
     def runMerge(self):
         """
         Runs the Merge script. Logs messages as necessary using logMessage().
@@ -620,12 +1369,20 @@ class Main(QMainWindow):
 
             # Enable any disabled directories
             for root, dirs, files in os.walk(target_dir):
+                # Prune in place so os.walk neither descends into ignored directories,
+                # nor looks for renamed ones under their old name
+                kept_dirs = []
                 for dir in dirs:
-                    if dir.upper().startswith("DISABLED"):
+                    if dir in IGNORED_MOD_DIR_NAMES or any(name in dir for name in IGNORED_MOD_DIRS):
+                        continue
+                    if dir.upper().startswith(DISABLED_PREFIX):
                         old_name = os.path.normpath( os.path.join(root, dir) )
-                        new_name = old_name[:-len(dir)] + dir[len("DISABLED"):]
+                        new_name = old_name[:-len(dir)] + dir[DISABLED_PREFIX_LEN:]
                         os.rename(old_name, new_name)
                         self.logMessage(f"Enabled mod folder for mod: {os.path.basename(new_name)}")
+                        dir = dir[DISABLED_PREFIX_LEN:]
+                    kept_dirs.append(dir)
+                dirs[:] = kept_dirs
 
             # Enable .ini files via the merge script
             use_flags = [*flags["root"], *flags["enable"]]
@@ -634,11 +1391,9 @@ class Main(QMainWindow):
             self.runScript(merge_script, target_dir, use_flags, "")
         else:
             use_flags = [item for sublist in flags.values() for item in sublist]
-            mod_order = self.getModOrder(flags["root"][1], flags["name"][1])
-            input_data = "\n"+ " ".join(map(str, mod_order)) + "\n"
             
             self.logMessage("Running [MERGE] script")
-            self.runScript(merge_script, target_dir, use_flags, input_data)
+            self.runScript(merge_script, target_dir, use_flags)    # runScript() sends the 'enter' key press
     
 
     def logMessage(self, error_message, msg_type=Color.INFO):
@@ -649,47 +1404,80 @@ class Main(QMainWindow):
         error_message (str): The error message to log.
         level (str): The type of message to log. Determines the color of the message.
         """
-        current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = logTimestamp(int(time.time()))
         color = msg_type.value
         log_entry = f'[{current_time}] <span style="color:{color}">{error_message}</span>'
-        self.ui.logTextEdit.append(log_entry)
+        if self.log_batch is not None:
+            self.log_batch.append(log_entry)    # Written out by flushLogBatch()
+        else:
+            self.ui.logTextEdit.append(log_entry)
+
+
+    def flushLogBatch(self):
+        """
+        Write every message collected since log_batch was started to the log in a single append,
+        then go back to writing messages as they are logged.
+        """
+        if self.log_batch:
+            self.ui.logTextEdit.append("<br>".join(self.log_batch))
+        self.log_batch = None
 
     
     def setIconGraphicsView(self):
         """
-        Set the logo image in the QGraphicsView.
+        Set the logo image in the QGraphicsView and the window icon.
         If a user-provided image is not found, display the default LogoImg.ico.
         """
         scene = QGraphicsScene()
 
-        # Try to load user-provided image
-        image_path = findLogoImg()
-        user_pixmap = QPixmap(image_path)
-
-        # Use user-provided image if it exists, otherwise use the embedded default image
-        if not user_pixmap.isNull():
-            pixmap = user_pixmap
-        else:
-            pixmap = QPixmap(":/LogoImg")
-
         # Get the dimensions of the QGraphicsView
         view_width = self.ui.IconGraphicsView.viewport().width()
         view_height = self.ui.IconGraphicsView.viewport().height()
 
-        # Scale the pixmap
-        scaled_pixmap = pixmap.scaled(view_width, view_height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        # Try to load user-provided image, decoded straight to the size of the view
+        image_path = findLogoImg()
+        image = loadImage(image_path, view_width, view_height) if image_path else QImage()
+        user_image_found = not image.isNull()
+
+        # Use user-provided image if it exists, otherwise use the embedded default image
+        if not user_image_found:
+            image = cachedImage(":/LogoImg", 0, view_width, view_height)    # Embedded resources never change
 
         # Calculate cropping area
-        x_offset = (scaled_pixmap.width() - view_width) / 2
-        y_offset = (scaled_pixmap.height() - view_height) / 2
-        cropped_pixmap = scaled_pixmap.copy(x_offset, y_offset, view_width, view_height)
+        x_offset = (image.width() - view_width) // 2
+        y_offset = (image.height() - view_height) // 2
+        cropped_pixmap = QPixmap.fromImage(image.copy(x_offset, y_offset, view_width, view_height))
 
         # Add the pixmap to the scene
         pixmap_item = QGraphicsPixmapItem(cropped_pixmap)
         scene.addItem(pixmap_item)
 
         self.ui.IconGraphicsView.setScene(scene)
-        self.setWindowIcon(QIcon(":/LogoImg"))
+        # QIcon only loads the user image at the sizes it is drawn at
+        self.setWindowIcon(QIcon(image_path) if user_image_found else QIcon(":/LogoImg"))
+
+
+    def closeEvent(self, event):
+        """
+        Wait for any mod scan or preview load still running before the window, and its threads, are destroyed.
+        A script still running is only stopped if the user confirms, as stopping it part way could leave mods half merged.
+        """
+        if self.script_process is not None and not self.script_process.waitForFinished(SCRIPT_CLOSE_WAIT_MS):
+            answer = QMessageBox.question(self, "GIMI ModUI", "A script is still running. Stopping it now could leave mods half merged.\n\nStop the script and close anyway?",
+                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if answer != QMessageBox.Yes:
+                event.ignore()
+                return
+            if self.script_process is not None:     # It may have finished while the question was shown
+                self.script_process.kill()
+                self.script_process.waitForFinished(SCRIPT_CLOSE_WAIT_MS)
+        for scan_thread in self.findChildren(ModScanThread):
+            scan_thread.wait()
+        self.saveModIndex()
+        self.cancelImageSearch()
+        QThreadPool.globalInstance().waitForDone()
+        prunePreviewCache(PREVIEW_CACHE_MAX_BYTES)   # No preview is being saved any more
+        super(Main, self).closeEvent(event)
 
 
 '''
@@ -707,46 +1495,518 @@ def findLogoImg():
     Returns:
         The path to the image. If no image is found, return an empty string
     """
-    for root, dirs, files in os.walk(os.getcwd()):
-        for file in files:
-            if file.startswith("LogoImg.") and file.lower().endswith((".png", ".jpg")):
-                return os.path.join(root, file)
-        return "" # Not found on top level
+    try:
+        with os.scandir(os.getcwd()) as it:
+            for entry in it:
+                if entry.name.startswith("LogoImg.") and entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                    return entry.path
+    except OSError:
+        pass    # Unreadable cwd, same as no image
+    return "" # Not found on top level
+
+def loadImage(image_path, width, height):
+    """
+    Load an image scaled to cover width x height while keeping its aspect ratio,
+    reusing the result if the file has not changed since it was last loaded.
+
+    Returns a QImage rather than a QPixmap so it can be called from a worker thread.
+
+    Args:
+        image_path (str): The path to the image.
+        width (int): The width the image must cover.
+        height (int): The height the image must cover.
+
+    Returns:
+        QImage: The scaled image. A null QImage if the image could not be loaded.
+    """
+    try:
+        mtime = os.stat(image_path).st_mtime_ns
+    except OSError:
+        return QImage()
+    return cachedImage(image_path, mtime, width, height)
+
+@lru_cache(maxsize=64)
+def cachedImage(image_path, mtime, width, height):
+    """
+    Get an image at the size loadImage() asks for. Results are cached by
+    path, modification time and size, so an edited image is decoded again.
+
+    Besides this in-memory cache, images on disk are kept scaled in the user's cache
+    directory, so later sessions load a small preview instead of decoding the original.
+    Using one marks it as recently used, see prunePreviewCache().
+    """
+    if image_path.startswith(":"):
+        return decodeImage(image_path, width, height)   # Embedded resource, nothing to keep on disk
+    cache_path = getPreviewCachePath(image_path, mtime, width, height)
+    image = QImage(cache_path)
+    if not image.isNull():
+        try:
+            os.utime(cache_path)    # Recently used, kept over older previews by prunePreviewCache()
+        except OSError:
+            pass
+        return image    # Scaled in an earlier session
+    image = decodeImage(image_path, width, height)
+    if not image.isNull():
+        savePreviewCache(image, cache_path)
+    return image
+
+def decodeImage(image_path, width, height):
+    """
+    Decode an image scaled to cover width x height while keeping its aspect ratio.
+
+    Decoding straight to the target size with QImageReader avoids holding the full
+    resolution image in memory, and lets JPEGs skip most of the decoding work.
+
+    Args:
+        image_path (str): The path to the image.
+        width (int): The width the image must cover.
+        height (int): The height the image must cover.
+
+    Returns:
+        QImage: The scaled image. A null QImage if the image could not be loaded.
+    """
+    reader = QImageReader(image_path)
+    image_size = reader.size()
+    if image_size.isValid():
+        reader.setScaledSize(image_size.scaled(width, height, Qt.KeepAspectRatioByExpanding))
+        return reader.read()
+    # Size is unknown until decoded for some formats, scale after loading instead
+    image = reader.read()
+    if image.isNull():
+        return image
+    return image.scaled(width, height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+@lru_cache(maxsize=1)
+def logTimestamp(seconds):
+    """
+    Format a log timestamp. Messages logged within the same second reuse the formatted string.
+
+    Args:
+        seconds (int): Seconds since the epoch.
+
+    Returns:
+        str: The local time as "YYYY-mm-dd HH:MM:SS".
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+def findModDirs(path, ignore=(), searched=None, skip=frozenset(), seen=None, ignore_names=frozenset(), mtimes=None):
+    """
+    Find every mod directory under path, where a mod directory is the first
+    directory on a branch that contains an .ini file.
+
+    Uses os.scandir so file/directory checks come from the directory listing
+    itself, and stops descending a branch as soon as its .ini is found.
+    Each directory is visited once, so junctions looping back up the tree
+    cannot make the search run forever.
+
+    Args:
+        path (str): The directory to search.
+        ignore (tuple, optional): Skip any directory whose name contains one of these strings.
+        searched (list, optional): If given, every directory searched that is not a mod directory
+                                   is appended to it, as is every directory in skip that was reached.
+        skip (set, optional): Full paths of directories not to descend into.
+        seen (dict, optional): Directories already visited, see isNewDirectory(). If given, path
+                               must already be recorded in it.
+        ignore_names (set, optional): Skip any directory whose name is one of these.
+        mtimes (dict, optional): If given, filled with full path => st_mtime_ns of every directory
+                                 visited, taken before it is listed. See isNewDirectory().
+
+    Yields:
+        str: The full path to each mod directory, in the same order os.walk would visit them.
+
+    Raises:
+        OSError: If path itself cannot be listed, e.g. FileNotFoundError if it does not exist.
+    """
+    stack = [path]
+    if seen is None:
+        seen = {}
+        isNewDirectory(path, seen, mtimes)
+    while stack:
+        root = stack.pop()
+        try:
+            has_ini, subdirs = listModDirectory(root, ignore, searched, skip, seen, ignore_names, mtimes)
+        except OSError:
+            if root == path:
+                raise   # Let the caller report a missing or unreadable starting directory
+            continue    # Unreadable directory, os.walk skips these as well
+
+        if has_ini:
+            yield root
+        else:
+            if searched is not None: searched.append(root)
+            stack.extend(reversed(subdirs))  # Reversed so children are visited in listing order
+
+def findModDirsParallel(path, ignore=(), searched=None, skip=frozenset(), ignore_names=frozenset(), mtimes=None):
+    """
+    Find every mod directory under path like findModDirs(), searching each of
+    path's children directories on its own thread.
+
+    Listing directories that are not cached yet mostly waits on the disk, so
+    several can be read at once. The threads share one record of the directories
+    visited, and the result is in the same order findModDirs() would give. Each call
+    starts its own thread pool, so it is only meant for full scans of "Mods".
+
+    Args:
+        path (str): The directory to search.
+        ignore (tuple, optional): Skip any directory whose name contains one of these strings.
+        searched (list, optional): Filled as findModDirs() fills it, though not in the same order.
+        skip (set, optional): Full paths of directories not to descend into.
+        ignore_names (set, optional): Skip any directory whose name is one of these.
+        mtimes (dict, optional): Filled as findModDirs() fills it.
+
+    Returns:
+        list: The full paths to the mod directories.
+
+    Raises:
+        OSError: If path itself cannot be listed, e.g. FileNotFoundError if it does not exist.
+    """
+    seen = {}
+    isNewDirectory(path, seen, mtimes)
+    has_ini, branches = listModDirectory(path, ignore, searched, skip, seen, ignore_names, mtimes)
+    if has_ini:
+        return [path]
+    if searched is not None: searched.append(path)
+
+    mod_dirs = []
+    with ThreadPoolExecutor() as pool:
+        for branch_mod_dirs, branch_searched in pool.map(partial(searchModBranch, ignore=ignore, skip=skip, seen=seen, ignore_names=ignore_names, mtimes=mtimes), branches):
+            mod_dirs.extend(branch_mod_dirs)
+            if searched is not None: searched.extend(branch_searched)
+    return mod_dirs
+
+def searchModBranch(branch, ignore, skip, seen, ignore_names, mtimes):
+    """
+    Search one of findModDirsParallel()'s branches with findModDirs(), on a worker thread.
+
+    Returns:
+        tuple: The mod directories found, and the directories searched.
+    """
+    searched = []
+    try:
+        return list(findModDirs(branch, ignore, searched, skip, seen, ignore_names, mtimes)), searched
+    except OSError:
+        return [], []   # Unreadable directory, findModDirs skips these as well
+
+def listModDirectory(root, ignore, searched, skip, seen, ignore_names, mtimes):
+    """
+    List one directory for findModDirs().
+
+    Returns:
+        tuple: (True, []) if root contains an .ini file, otherwise (False, the children directories to search).
 
-def findModDirectory(mod_name):
+    Raises:
+        OSError: If root cannot be listed.
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path in skip:
+                    if searched is not None: searched.append(entry.path)
+                elif entry.name not in ignore_names and not any(name in entry.name for name in ignore) and isNewDirectory(entry.path, seen, mtimes):
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".ini") and entry.is_file():
+                return True, []     # Stop searching deeper once an .ini file is found
+    return False, subdirs
+
+def findModDirectory(mod_name, modding_dir=None):
     """
     Find the directory containing the mod.
 
     Args:
         mod_name (str): The name of the mod to find.
+        modding_dir (str, optional): The directory to search. Defaults to the "Mods" folder in the cwd.
+
+    Returns:
+        str: The full path to the directory containing the mod, or an empty string if not found.
+    """
+    if modding_dir is None:
+        modding_dir = os.path.join(os.getcwd(), "Mods")
+    disabled_name = DISABLED_PREFIX + mod_name     # Built once, not for every directory compared
+    stack = [modding_dir]
+    seen = {}
+    isNewDirectory(modding_dir, seen)
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    name = entry.name
+                    if name == mod_name or name == disabled_name:
+                        return entry.path
+                    if entry.is_dir(follow_symlinks=False) and isNewDirectory(entry.path, seen):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue    # Missing or unreadable directory, os.walk skips these as well
+        stack.extend(reversed(subdirs))  # Reversed so children are visited in listing order, as os.walk would
+    return ""
+
+def findImages(path):
+    """
+    Find every .png and .jpg image in a directory and its children directories.
+
+    Uses os.scandir so each image's path comes straight from the directory listing,
+    rather than being joined together for every file. Hidden directories, such as
+    a .git folder, and __pycache__ are not searched.
+
+    Args:
+        path (str): The directory to search.
+
+    Yields:
+        str: The full path to each image, in the order os.walk finds them.
+    """
+    stack = [path]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.name != "__pycache__":
+                            subdirs.append(entry.path)  # Hidden folders, e.g. .git, and caches hold no previews
+                    elif entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue    # Missing or unreadable directory, os.walk skips these as well
+        stack.extend(reversed(subdirs))  # Reversed so children are visited in listing order, as os.walk would
+
+def getModIndexPath():
+    """
+    Get the path of the file the mod index is saved to between sessions.
+
+    Returns:
+        str: The path to mod_index.json in the user's config directory, next to where QSettings keeps its file.
+    """
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericConfigLocation), "GIMI ModUI", "mod_index.json")
+
+def getPreviewCachePath(image_path, mtime, width, height):
+    """
+    Get the path a scaled image is kept at by savePreviewCache().
+
+    Args:
+        image_path (str): The path to the original image.
+        mtime (int): The original image's st_mtime_ns, so an edited image gets a new path.
+        width (int): The width the image was scaled to cover.
+        height (int): The height the image was scaled to cover.
+
+    Returns:
+        str: The path to a .png named after a hash of the arguments, in the user's cache directory.
+    """
+    key = hashlib.sha1(f"{image_path}|{mtime}|{width}x{height}".encode("utf-8")).hexdigest()
+    return os.path.join(getPreviewCacheDir(), key + ".png")
+
+def getPreviewCacheDir():
+    """
+    Get the directory scaled previews are kept in between sessions.
+
+    Returns:
+        str: The path to the previews folder in the user's cache directory.
+    """
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation), "GIMI ModUI", "previews")
+
+def prunePreviewCache(max_bytes):
+    """
+    Remove the least recently used previews kept by savePreviewCache() until the rest fit in max_bytes.
+    Previews of deleted mods and replaced images are never used again, so they are the first to go.
+    Temporary files left by an interrupted save are removed too. Must not run while previews are being saved.
+
+    Args:
+        max_bytes (int): The most bytes of previews to keep.
+    """
+    previews = []   # (last used, size, path)
+    try:
+        with os.scandir(getPreviewCacheDir()) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".tmp"):
+                    removeFile(entry.path)
+                    continue
+                stat = entry.stat()
+                previews.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    except OSError:
+        return  # No previews kept yet, or the folder cannot be read
+    total_bytes = sum(size for _, size, _ in previews)
+    for _, size, path in sorted(previews):  # Oldest first
+        if total_bytes <= max_bytes:
+            break
+        if removeFile(path):
+            total_bytes -= size
+
+def removeFile(path):
+    """
+    Remove a file, if possible. Failing to remove it is not an error.
+
+    Args:
+        path (str): The file to remove.
+
+    Returns:
+        bool: True if the file was removed. False if not, e.g. because it is in use or read-only.
+    """
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+def savePreviewCache(image, cache_path):
+    """
+    Save a scaled image for cachedImage() to load in later sessions. Failing to save is not an error.
+
+    The image is written to a temporary file first and then moved into place, so a preview
+    loading at the same time on another thread never reads a half written file.
+
+    Args:
+        image (QImage): The scaled image.
+        cache_path (str): The path from getPreviewCachePath().
+    """
+    temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        if image.save(temp_path, "PNG"):
+            os.replace(temp_path, cache_path)
+        elif os.path.exists(temp_path):
+            os.remove(temp_path)
+    except OSError:
+        pass    # Read-only or full disk, the image is simply decoded again next time
+
+def findModInDirs(mod_name, dirs):
+    """
+    Find the directory of a mod directly inside one of dirs, whether it is enabled or disabled.
+
+    Args:
+        mod_name (str): The name of the mod to find.
+        dirs (list): Full paths of the directories to check.
 
     Returns:
-        str: The full path to the directory containing the mod, or None if not found.
+        str: The full path to the mod's directory, or an empty string if not found.
     """
-    modding_dir = os.path.join(os.getcwd(), "Mods")
-    for root, dirs, files in os.walk(modding_dir):
-        for name in dirs:
-            if name == mod_name or name == f"DISABLED{mod_name}":
-                return os.path.join(root, name)
+    for parent_dir in dirs:
+        for name in (mod_name, DISABLED_PREFIX + mod_name):
+            mod_dir = os.path.join(parent_dir, name)
+            if os.path.isdir(mod_dir):
+                return mod_dir
     return ""
 
+def isInAny(path, dirs):
+    """
+    Checks if a path is one of dirs, or inside one of them.
+
+    Args:
+        path (str): The path to check.
+        dirs (set): Full paths of directories.
+    Returns:
+        bool: True if path or one of its parent directories is in dirs. False if not.
+    """
+    while path not in dirs:
+        parent = os.path.dirname(path)
+        if parent == path:
+            return False    # Reached the top of the drive
+        path = parent
+    return True
+
+def isNewDirectory(path, seen, mtimes=None):
+    """
+    Record a directory in seen by its device and inode, following symlinks and junctions.
+
+    Args:
+        path (str): The directory to record.
+        seen (dict): (device, inode) => path of the directories recorded so far. A single setdefault()
+                     checks and records a directory, so threads can share it.
+        mtimes (dict, optional): If given, a new directory's st_mtime_ns is recorded in it by path,
+                                 from the same stat, before the directory is listed.
+
+    Returns:
+        bool: False if the directory was already recorded or cannot be read, True otherwise.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    # A filesystem without inode numbers cannot tell directories apart, every one counts as new
+    if stat.st_ino and seen.setdefault((stat.st_dev, stat.st_ino), path) != path:
+        return False
+    if mtimes is not None:
+        mtimes[path] = stat.st_mtime_ns
+    return True
+
 def getScript(path, script_type="SCRIPT"):
     """
     Attempt to find a .py or .exe script at the top-most level of a path.
+    If there are several, the alphabetically first one is returned.
 
     Parameters:
     path (str): The path to check for scripts
     script_type (str, optional): The type of script it is. Ex: MERGE
     """
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Missing folder(s): {os.path.normpath(path)}")
-    
-    for _, _, files in os.walk(path):
-        for file in files:
-            if isExeOrPy(file):
-                return os.path.normpath(os.path.join(path, file))
-        # No valid file found    
-        raise FileNotFoundError(f"No valid [{script_type}] file found. Please ensure you have a valid [{script_type}] file in {os.path.normpath(path)}")
+    try:
+        with os.scandir(path) as it:    # Only the top level, files only
+            scripts = [entry.path for entry in it if isExeOrPy(entry.name) and entry.is_file()]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing folder(s): {os.path.normpath(path)}") from None
+    if scripts:
+        return os.path.normpath(min(scripts, key=str.lower))  # Alphabetically first, listing order differs between filesystems
+    # No valid file found
+    raise FileNotFoundError(f"No valid [{script_type}] file found. Please ensure you have a valid [{script_type}] file in {os.path.normpath(path)}")
+
+def createModItem(mod_dir):
+    """
+    Create a list item for a mod directory.
+
+    The item shows the directory's name, has its path as the tooltip, and keeps
+    the path under Qt.UserRole so it never has to be looked up by name.
+
+    Args:
+        mod_dir (str): The full path to the mod directory.
+
+    Returns:
+        QListWidgetItem: The new item.
+    """
+    mod_dir = os.path.normpath(mod_dir)
+    item = QListWidgetItem(os.path.basename(mod_dir))
+    item.setToolTip(mod_dir)
+    item.setData(Qt.UserRole, mod_dir)
+    return item
+
+def clearCurrentItem(list_widgets):
+    """
+    Clear the current item and selection of QListWidgets, without emitting currentItemChanged.
+
+    Args:
+        list_widgets (list): The lists to clear the current item of.
+    """
+    for list_widget in list_widgets:
+        list_widget.blockSignals(True)
+        try:
+            list_widget.setCurrentRow(-1)
+            list_widget.clearSelection()
+        finally:
+            list_widget.blockSignals(False)
+
+def addListItems(list_widget, items):
+    """
+    Add several items to a QListWidget in one batch.
+
+    Repainting and sorting are suspended while the items are inserted, so the
+    list is laid out and sorted once instead of once per item.
+
+    Args:
+        list_widget (QListWidget): The list to add the items to.
+        items (list): The QListWidgetItems to add.
+    """
+    was_sorting = list_widget.isSortingEnabled()
+    list_widget.setUpdatesEnabled(False)
+    list_widget.setSortingEnabled(False)
+    try:
+        for item in items:
+            list_widget.addItem(item)
+    finally:
+        list_widget.setSortingEnabled(was_sorting)  # Re-enabling sorting sorts the list once
+        list_widget.setUpdatesEnabled(True)
 
 def isExeOrPy(path):
     """
@@ -757,7 +2017,7 @@ def isExeOrPy(path):
     Returns:
         bool: True if path is a ".exe" or ".py" file. False if not.
     """
-    return path.lower().endswith((".exe", ".py"))
+    return path.lower().endswith(SCRIPT_EXTENSIONS)
 
 def getMainStyles():
     styles = """
@@ -813,6 +2073,19 @@ def getMainStyles():
                            """
     return styles
 
+def getDarkStyles():
+    """
+    Returns the main styles with the Dark mode overrides appended.
+    """
+    return getMainStyles() + """ 
+            #MainWindow, #centralwidget, #manageTab, #mergeTab{
+                background-color: #252530;
+            }
+            .QLabel, .QGroupBox, .QCheckBox:unchecked:enabled{
+                color: white;
+            }
+            """
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     window = Main()